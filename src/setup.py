@@ -35,6 +35,9 @@ setup(
         "fakeredis",
         "pytz",
         "pyotp",
+        "google-auth",
+        "msal",
+        "requests",
     ],
     package_data={
         "spaceone": [
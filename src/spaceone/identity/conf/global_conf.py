@@ -113,6 +113,12 @@ CONNECTORS = {
         # "user": "cloudforet",
         # "password": "1234",
         # "from_email": "support@cloudforet.com",
+        # OAuth2 (gmail)
+        # "client_id": "",
+        # "client_secret": "",
+        # "refresh_token": "",
+        # OAuth2 (microsoft)
+        # "tenant_id": "",
     },
 }
 
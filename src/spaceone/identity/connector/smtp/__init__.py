@@ -0,0 +1,6 @@
+from spaceone.identity.connector.smtp.base import SMTPConnector
+from spaceone.identity.connector.smtp.basic_connector import BasicSMTPConnector
+from spaceone.identity.connector.smtp.gmail_connector import GmailSMTPConnector
+from spaceone.identity.connector.smtp.microsoft_connector import (
+    MicrosoftSMTPConnector,
+)
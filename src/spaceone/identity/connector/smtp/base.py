@@ -0,0 +1,327 @@
+import base64
+import functools
+import io
+import logging
+import queue
+import re
+import socket
+import threading
+import time
+from email.generator import BytesGenerator
+from email.header import Header
+from email.mime.text import MIMEText
+from email.policy import SMTP as SMTP_POLICY
+from typing import List, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from spaceone.core.connector import BaseConnector
+
+from spaceone.identity.error.error_smtp import *
+
+__all__ = ["SMTPConnector"]
+
+_LOGGER = logging.getLogger(__name__)
+
+# Fuses split + per-element strip into one C-level pass.
+_SPLIT_RCPT = re.compile(r"\s*,\s*")
+
+# A hung peer must not stall a gRPC worker indefinitely.
+SMTP_TIMEOUT = 10
+
+# SASL XOAUTH2 initial response framing (RFC 7628 / XOAUTH2).
+_XOAUTH2_USER_PREFIX = b"user="
+_XOAUTH2_AUTH_PREFIX = b"\x01auth=Bearer "
+_XOAUTH2_TAIL = b"\x01\x01"
+
+# Process-wide OAuth2 access-token cache shared by every provider
+# connector instance: key -> (access_token, expires_at). Tokens are minted
+# through a blocking HTTPS round-trip, so they must survive the per-send
+# connector instantiation.
+_TOKEN_CACHE = {}
+_TOKEN_CACHE_LOCK = threading.Lock()
+_TOKEN_TTL_MARGIN = 60
+
+# A batch this large with a third of its sends failing is aborted early
+# instead of hammering a struggling server with the remainder.
+_BATCH_ABORT_MIN_SIZE = 30
+
+# Keep-alive pool of live SMTP sessions: key -> Queue[(smtp, deadline)].
+# Establishing a session costs a TCP + TLS handshake plus AUTH, so sends
+# reuse sessions until they expire or fail a noop() liveness probe.
+_SMTP_POOL = {}
+_SMTP_POOL_LOCK = threading.Lock()
+_SMTP_POOL_MAX_SIZE = 4
+_SMTP_POOL_TTL = 300
+
+# provider_type -> connector class, filled by __init_subclass__ so provider
+# lookup is a dict access instead of a __subclasses__() walk per send.
+_PROVIDER_REGISTRY = {}
+
+# Shared keep-alive session for token-refresh HTTP calls. Both google-auth
+# and MSAL otherwise open a fresh HTTPS connection (full TLS handshake) to
+# their token endpoint per refresh.
+HTTP_SESSION = requests.Session()
+HTTP_SESSION.mount(
+    "https://", HTTPAdapter(pool_connections=4, pool_maxsize=16, pool_block=False)
+)
+
+
+def _build_body_bytes(html: str) -> bytes:
+    """Encode an HTML body to wire-format MIME bytes (headers included).
+
+    Deliberately uncached: every rendered body embeds a per-send secret
+    (verification code, reset link or temporary password), so caching
+    would never hit and would pin those secrets in process memory.
+    """
+
+    buffer = io.BytesIO()
+    BytesGenerator(buffer, policy=SMTP_POLICY, mangle_from_=False).flatten(
+        MIMEText(html, "html", "utf-8")
+    )
+    return buffer.getvalue()
+
+
+def _encode_header_value(value: str) -> str:
+    try:
+        value.encode("ascii")
+        return value
+    except UnicodeEncodeError:
+        # Fold with CRLF: smtplib only normalizes line endings for str
+        # payloads, and a bare LF inside a bytes payload is rejected by
+        # Gmail and Office 365.
+        return Header(value, "utf-8").encode(linesep="\r\n")
+
+
+def get_cached_token(key: tuple):
+    with _TOKEN_CACHE_LOCK:
+        cached = _TOKEN_CACHE.get(key)
+
+    if cached:
+        access_token, expires_at = cached
+        if time.monotonic() < expires_at - _TOKEN_TTL_MARGIN:
+            return access_token
+
+    return None
+
+
+def set_cached_token(key: tuple, access_token: str, expires_in: float) -> None:
+    with _TOKEN_CACHE_LOCK:
+        _TOKEN_CACHE[key] = (access_token, time.monotonic() + expires_in)
+
+
+class SMTPConnector(BaseConnector):
+    # BaseConnector resolves self.config from CONNECTORS[self.name or
+    # class name]; every provider subclass must read the shared
+    # "SMTPConnector" section, not one named after itself.
+    name = "SMTPConnector"
+
+    provider_type: str = None
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        _LOGGER.debug("[__init__] config keys=%s", list(self.config))
+        self.smtp = None
+        self.host = self.config.get("host")
+        self.port = self.config.get("port")
+        self.from_email = self.config.get("from_email")
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if cls.provider_type:
+            _PROVIDER_REGISTRY[cls.provider_type] = cls
+
+    @classmethod
+    def get_connector_by_provider(
+        cls, provider_type: str, *args, **kwargs
+    ) -> "SMTPConnector":
+        connector_class = _PROVIDER_REGISTRY.get(provider_type)
+        if connector_class is None:
+            raise ERROR_SMTP_NOT_SUPPORTED_PROVIDER(provider_type=provider_type)
+        return connector_class(*args, **kwargs)
+
+    def connect(self) -> None:
+        raise NotImplementedError("SMTPConnector.connect not implemented!")
+
+    def send_email(
+        self, to_emails: Union[str, List[str]], subject: str, contents: str
+    ) -> None:
+        recipient_list = self._normalize_recipients(to_emails)
+        rendered = self._render_message(recipient_list, subject, contents)
+
+        smtp = self._checkout()
+
+        try:
+            response = smtp.sendmail(self.from_email, recipient_list, rendered)
+        except Exception as e:
+            self._discard(smtp)
+            _LOGGER.error(f"[send_email] send email failed: {e}")
+            raise ERROR_SMTP_SEND_EMAIL_FAILED()
+
+        if response:
+            _LOGGER.debug(f"[send_email] send email response : {response}")
+
+        self._checkin(smtp)
+
+    def send_batch(self, messages: List[dict]) -> None:
+        """Send many emails over a single held SMTP session.
+
+        Each message is a dict with ``to_emails``, ``subject`` and
+        ``contents`` keys. An ``RSET`` between messages keeps the session
+        reusable; a session that dies mid-batch is re-established once per
+        failure, and a batch of at least ``_BATCH_ABORT_MIN_SIZE`` messages
+        is aborted when a third of it has failed.
+        """
+
+        total = len(messages)
+        failed = 0
+        smtp = self._checkout()
+
+        try:
+            for message in messages:
+                if total >= _BATCH_ABORT_MIN_SIZE and failed * 3 >= total:
+                    _LOGGER.error(
+                        f"[send_batch] aborting batch: {failed}/{total} sends failed"
+                    )
+                    raise ERROR_SMTP_SEND_EMAIL_FAILED()
+
+                recipient_list = self._normalize_recipients(message["to_emails"])
+                rendered = self._render_message(
+                    recipient_list, message["subject"], message["contents"]
+                )
+
+                try:
+                    smtp.sendmail(self.from_email, recipient_list, rendered)
+                    smtp.rset()
+                except Exception as e:
+                    failed += 1
+                    _LOGGER.warning(
+                        f"[send_batch] send to {recipient_list} failed: {e}"
+                    )
+
+                    try:
+                        alive = smtp.noop()[0] == 250
+                    except Exception:
+                        alive = False
+
+                    if not alive:
+                        self._discard(smtp)
+                        smtp = self._checkout()
+        finally:
+            self._checkin(smtp)
+
+        if failed:
+            raise ERROR_SMTP_SEND_EMAIL_FAILED()
+
+    def __enter__(self) -> "SMTPConnector":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.quit_smtp()
+
+    @staticmethod
+    def _normalize_recipients(to_emails: Union[str, List[str]]) -> List[str]:
+        if isinstance(to_emails, str):
+            return _SPLIT_RCPT.split(to_emails.strip()) if to_emails else []
+        return list(to_emails)
+
+    def _render_message(
+        self, recipient_list: List[str], subject: str, contents: str
+    ) -> bytes:
+        # The body only ever holds a single HTML part, so skip the
+        # multipart/alternative wrapper: prepend the envelope headers to the
+        # cached body bytes (which already carry MIME-Version/Content-Type).
+        headers = (
+            f"Subject: {_encode_header_value(subject)}\r\n"
+            f"From: {_encode_header_value(self.from_email)}\r\n"
+            f"To: {_encode_header_value(', '.join(recipient_list))}\r\n"
+        ).encode("ascii")
+        return headers + _build_body_bytes(contents)
+
+    def quit_smtp(self) -> None:
+        if self.smtp:
+            self.smtp.quit()
+            self.smtp = None
+
+    def _pool_key(self) -> tuple:
+        return self.provider_type, self.host, self.port, self.from_email
+
+    def _get_pool(self) -> queue.Queue:
+        key = self._pool_key()
+        with _SMTP_POOL_LOCK:
+            pool = _SMTP_POOL.get(key)
+            if pool is None:
+                pool = _SMTP_POOL[key] = queue.Queue(maxsize=_SMTP_POOL_MAX_SIZE)
+        return pool
+
+    def _checkout(self):
+        # Reuse a session established by connect() (e.g. a connection probe)
+        # before touching the pool.
+        if self.smtp is not None:
+            smtp, self.smtp = self.smtp, None
+            return smtp
+
+        pool = self._get_pool()
+
+        while True:
+            try:
+                smtp, deadline = pool.get_nowait()
+            except queue.Empty:
+                break
+
+            if time.monotonic() < deadline:
+                try:
+                    if smtp.noop()[0] == 250:
+                        return smtp
+                except Exception:
+                    pass
+
+            self._discard(smtp)
+
+        self.connect()
+        smtp, self.smtp = self.smtp, None
+        return smtp
+
+    def _checkin(self, smtp) -> None:
+        try:
+            self._get_pool().put_nowait((smtp, time.monotonic() + _SMTP_POOL_TTL))
+        except queue.Full:
+            self._discard(smtp)
+
+    @staticmethod
+    def _discard(smtp) -> None:
+        try:
+            smtp.quit()
+        except Exception:
+            pass
+
+    @staticmethod
+    def _tune_socket(smtp) -> None:
+        """Disable Nagle (the EHLO/AUTH/MAIL/RCPT/DATA chatter is all small
+        packets) and enable keep-alive so pooled sessions are not silently
+        reaped by NAT."""
+
+        sock = getattr(smtp, "sock", None)
+        if sock is not None:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def generate_xoauth2_arg(user: str, access_token: str) -> str:
+        # user and token are guaranteed ASCII, so build the SASL buffer at
+        # the bytes level instead of f-string + utf-8 encode round-trips.
+        # Cached by (user, access_token): every reconnect within a token's
+        # lifetime reuses the encoded blob, and entries age out of the LRU
+        # together with their tokens.
+        auth_bytes = b"".join(
+            (
+                _XOAUTH2_USER_PREFIX,
+                user.encode("ascii"),
+                _XOAUTH2_AUTH_PREFIX,
+                access_token.encode("ascii"),
+                _XOAUTH2_TAIL,
+            )
+        )
+        return "XOAUTH2 " + base64.b64encode(auth_bytes).decode("ascii")
@@ -0,0 +1,31 @@
+import logging
+import smtplib
+
+from spaceone.identity.connector.smtp.base import SMTP_TIMEOUT, SMTPConnector
+from spaceone.identity.error.error_smtp import *
+
+__all__ = ["BasicSMTPConnector"]
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class BasicSMTPConnector(SMTPConnector):
+    provider_type = "basic"
+
+    def connect(self) -> None:
+        user = self.config.get("user")
+        password = self.config.get("password")
+
+        try:
+            # smtplib.SMTP(host, port) already connects; an explicit
+            # connect() here would open a second socket.
+            self.smtp = smtplib.SMTP(self.host, self.port, timeout=SMTP_TIMEOUT)
+            self.smtp.ehlo()
+            self.smtp.starttls()
+            self._tune_socket(self.smtp)
+            self.smtp.login(user, password)
+        except Exception as e:
+            _LOGGER.error(
+                f"[connect] basic smtp connection failed: Please check smtp config {e}"
+            )
+            raise ERROR_SMTP_CONNECTION_FAILED()
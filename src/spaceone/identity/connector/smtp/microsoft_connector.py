@@ -0,0 +1,159 @@
+import logging
+import smtplib
+import threading
+
+from spaceone.identity.connector.smtp.base import (
+    HTTP_SESSION,
+    SMTP_TIMEOUT,
+    SMTPConnector,
+    get_cached_token,
+    set_cached_token,
+)
+from spaceone.identity.error.error_smtp import *
+
+__all__ = ["MicrosoftSMTPConnector"]
+
+_LOGGER = logging.getLogger(__name__)
+
+_MICROSOFT_HOST = "smtp.office365.com"
+_MICROSOFT_PORT = 587
+_DEFAULT_TOKEN_LIFETIME = 3600
+
+_MS_AUTHORITY_TMPL = "https://login.microsoftonline.com/{}".format
+_MS_SCOPES = ["https://outlook.office365.com/.default"]
+
+# MSAL keeps an in-process token cache on the application object, so the
+# app must outlive the per-send connector instances to be of any use.
+_MSAL_APPS = {}
+_MSAL_APPS_LOCK = threading.Lock()
+
+# Single-flight lock per (tenant_id, client_id): concurrent senders that
+# all find the token cache empty would otherwise each fire their own
+# HTTPS round-trip to login.microsoftonline.com.
+_TOKEN_LOCKS = {}
+_TOKEN_LOCKS_LOCK = threading.Lock()
+
+# Imported lazily: msal pulls in cryptography and friends, which
+# deployments using other providers should not pay for at startup. The
+# sentinel makes repeat calls a plain global read instead of a
+# sys.modules lookup through the import machinery.
+_msal = None
+
+
+def _load_msal():
+    global _msal
+    if _msal is None:
+        import msal
+
+        _msal = msal
+    return _msal
+
+
+def _get_token_lock(key: tuple) -> threading.Lock:
+    with _TOKEN_LOCKS_LOCK:
+        lock = _TOKEN_LOCKS.get(key)
+        if lock is None:
+            lock = _TOKEN_LOCKS[key] = threading.Lock()
+    return lock
+
+
+class MicrosoftSMTPConnector(SMTPConnector):
+    provider_type = "microsoft"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        cfg = self.config
+
+        # Credentials first: a misconfigured connector fails before paying
+        # the host/port defaulting it would never use.
+        client_id = cfg.get("client_id")
+        client_secret = cfg.get("client_secret")
+        tenant_id = cfg.get("tenant_id")
+
+        if not (client_id and client_secret and tenant_id):
+            raise ERROR_SMTP_CONNECTION_FAILED()
+
+        self.client_id = client_id
+        self.client_secret = client_secret
+        self.tenant_id = tenant_id
+        self._authority = _MS_AUTHORITY_TMPL(tenant_id)
+
+        self.host = self.host or _MICROSOFT_HOST
+        self.port = self.port or _MICROSOFT_PORT
+
+    def connect(self) -> None:
+        access_token = self._get_access_token()
+
+        try:
+            self.smtp = smtplib.SMTP(self.host, self.port, timeout=SMTP_TIMEOUT)
+            self.smtp.ehlo()
+            self.smtp.starttls()
+            self.smtp.ehlo()
+            self._tune_socket(self.smtp)
+            self._authenticate(access_token)
+        except ERROR_SMTP_CONNECTION_FAILED:
+            raise
+        except Exception as e:
+            _LOGGER.error(
+                f"[connect] microsoft smtp connection failed: "
+                f"Please check smtp config {e}"
+            )
+            raise ERROR_SMTP_CONNECTION_FAILED()
+
+    def _authenticate(self, access_token: str) -> None:
+        auth_arg = self.generate_xoauth2_arg(self.from_email, access_token)
+        code, response = self.smtp.docmd("AUTH", auth_arg)
+
+        if code != 235:
+            _LOGGER.error(f"[_authenticate] authentication failed: {code} {response}")
+            raise ERROR_SMTP_CONNECTION_FAILED()
+
+    def _get_access_token(self) -> str:
+        cache_key = (self.tenant_id, self.client_id)
+
+        if access_token := get_cached_token(cache_key):
+            return access_token
+
+        with _get_token_lock(cache_key):
+            # The thread that held the lock may have refreshed the token
+            # while we were waiting for it.
+            if access_token := get_cached_token(cache_key):
+                return access_token
+
+            app = self._get_msal_app()
+            result = app.acquire_token_silent(_MS_SCOPES, account=None)
+
+            if not result:
+                result = app.acquire_token_for_client(scopes=_MS_SCOPES)
+
+            if "access_token" not in result:
+                _LOGGER.error(
+                    f"[_get_access_token] token acquisition failed: "
+                    f"{result.get('error')} {result.get('error_description')}"
+                )
+                raise ERROR_SMTP_CONNECTION_FAILED()
+
+            set_cached_token(
+                cache_key,
+                result["access_token"],
+                result.get("expires_in", _DEFAULT_TOKEN_LIFETIME),
+            )
+            return result["access_token"]
+
+    def _get_msal_app(self):
+        key = (self.tenant_id, self.client_id)
+
+        with _MSAL_APPS_LOCK:
+            app = _MSAL_APPS.get(key)
+
+            if app is None:
+                msal = _load_msal()
+
+                app = _MSAL_APPS[key] = msal.ConfidentialClientApplication(
+                    self.client_id,
+                    authority=self._authority,
+                    client_credential=self.client_secret,
+                    http_client=HTTP_SESSION,
+                )
+
+        return app
@@ -1,54 +1,101 @@
 import logging
-import smtplib
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
-
-from spaceone.identity.error.error_smtp import *
+import time
+from typing import List, Union
 
+from spaceone.core import utils
 from spaceone.core.connector import BaseConnector
 
+from spaceone.identity.connector.smtp.base import SMTPConnector as BaseSMTPConnector
+from spaceone.identity.error.error_smtp import *
+
 __all__ = ["SMTPConnector"]
 
 _LOGGER = logging.getLogger(__name__)
 
+_FAILURE_TTL = 300
+
 
 class SMTPConnector(BaseConnector):
+    """Facade that connects through the first SMTP provider accepted by the
+    configured credentials (gmail -> microsoft -> basic)."""
+
+    # (provider, config key that marks it as configured), in fallback order.
+    _PROVIDERS = (
+        ("gmail", "refresh_token"),
+        ("microsoft", "tenant_id"),
+        ("basic", "user"),
+    )
+
+    # Remembered per config hash across instances, so a deployment whose
+    # first configured providers are broken does not pay a failed connect
+    # on every send: the last working method is tried first and recently
+    # failed methods are skipped for _FAILURE_TTL seconds.
+    _last_success = {}
+    _recent_failures = {}
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.smtp = None
-        host = self.config.get("host")
-        port = self.config.get("port")
-        user = self.config.get("user")
-        password = self.config.get("password")
-        self.from_email = self.config.get("from_email")
-        self.set_smtp(host, port, user, password)
-
-    def set_smtp(self, host, port, user, password):
-        try:
-            self.smtp = smtplib.SMTP(host, port)
-            self.smtp.connect(host, port)
-            self.smtp.ehlo()
-            self.smtp.starttls()
-            self.smtp.login(user, password)
-        except Exception as e:
-            _LOGGER.error(f"[set_smtp] set smtp failed : Please check smtp config {e}")
-            raise ERROR_SMTP_CONNECTION_FAILED()
-
-    def send_email(self, to_emails, subject, contents):
-        multipart_msg = MIMEMultipart("alternative")
-
-        multipart_msg["Subject"] = subject
-        multipart_msg["From"] = self.from_email
-        multipart_msg["To"] = to_emails
-
-        multipart_msg.attach(MIMEText(contents, "html"))
-
-        response = self.smtp.sendmail(
-            self.from_email, to_emails.split(","), multipart_msg.as_string()
-        )
-
-        if response:
-            _LOGGER.debug(f"[send_email] send email response : {response}")
-
-    def quit_smtp(self):
-        self.smtp.quit()
+        self._connector = None
+        self._errors = []
+        self._methods = [
+            provider
+            for provider, required_key in self._PROVIDERS
+            if self.config.get(required_key)
+        ]
+
+    def send_email(
+        self, to_emails: Union[str, List[str]], subject: str, contents: str
+    ) -> None:
+        if self._connector is None:
+            self._connect()
+        self._connector.send_email(to_emails, subject, contents)
+
+    def send_batch(self, messages: List[dict]) -> None:
+        if self._connector is None:
+            self._connect()
+        self._connector.send_batch(messages)
+
+    def quit_smtp(self) -> None:
+        if self._connector:
+            self._connector.quit_smtp()
+
+    def __enter__(self) -> "SMTPConnector":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.quit_smtp()
+
+    def _connect(self) -> None:
+        self._errors = []
+
+        cfg_hash = utils.dict_to_hash(self.config)
+        methods = list(self._methods)
+
+        if last_success := self._last_success.get(cfg_hash):
+            methods.sort(key=lambda provider: provider != last_success)
+
+        now = time.monotonic()
+
+        for provider in methods:
+            retry_at = self._recent_failures.get((cfg_hash, provider))
+            if retry_at and now < retry_at:
+                continue
+
+            try:
+                connector = BaseSMTPConnector.get_connector_by_provider(provider)
+                connector.connect()
+            except Exception as e:
+                _LOGGER.warning(f"[_connect] {provider} connection failed: {e}")
+                self._errors.append((provider, e))
+                self._recent_failures[(cfg_hash, provider)] = (
+                    time.monotonic() + _FAILURE_TTL
+                )
+                continue
+
+            self._connector = connector
+            self._last_success[cfg_hash] = provider
+            self._recent_failures.pop((cfg_hash, provider), None)
+            return
+
+        _LOGGER.error(f"[_connect] all connection methods failed: {self._errors}")
+        raise ERROR_SMTP_CONNECTION_FAILED()
@@ -1,5 +1,48 @@
+from string import Formatter
+
 from spaceone.core.error import *
 
+_FORMATTER = Formatter()
+
+
+class _StaticMessage(str):
+    """Message template without placeholders.
+
+    The base error class runs ``_message.format(**kwargs)`` on every raise,
+    which re-parses the template each time. For field-less templates -
+    raised in loops on batch-send failures - format() just returns the
+    string itself; the no-fields check runs once at import.
+    """
+
+    # str subclasses grow a per-instance __dict__ without this.
+    __slots__ = ()
+
+    def __new__(cls, template: str):
+        if any(
+            field is not None for _, field, _, _ in _FORMATTER.parse(template)
+        ):
+            raise ValueError(f"static message template has fields: {template}")
+        return super().__new__(cls, template)
+
+    def format(self, *args, **kwargs) -> str:
+        return self
+
 
 class ERROR_SMTP_CONNECTION_FAILED(ERROR_UNKNOWN):
-    _message = "SMTP server connection failed. Please contact the administrator."
+    __slots__ = ()
+
+    _message = _StaticMessage(
+        "SMTP server connection failed. Please contact the administrator."
+    )
+
+
+class ERROR_SMTP_SEND_EMAIL_FAILED(ERROR_UNKNOWN):
+    __slots__ = ()
+
+    _message = _StaticMessage(
+        "Failed to send email. Please contact the administrator."
+    )
+
+
+class ERROR_SMTP_NOT_SUPPORTED_PROVIDER(ERROR_INVALID_ARGUMENT):
+    _message = "Not supported SMTP provider. (provider_type = {provider_type})"
@@ -1,5 +1,7 @@
 from spaceone.core.pygrpc.server import GRPCServer
 
+from spaceone.identity.lib.profiling import apply_profiling_interceptor
+
 from spaceone.identity.interface.grpc.agent import Agent
 from spaceone.identity.interface.grpc.app import App
 from spaceone.identity.interface.grpc.domain import Domain
@@ -27,6 +29,8 @@ from spaceone.identity.interface.grpc.workspace_user import WorkspaceUser
 
 _all_ = ["app"]
 
+apply_profiling_interceptor()
+
 app = GRPCServer()
 app.add_service(System)
 app.add_service(Domain)
@@ -0,0 +1,309 @@
+import atexit
+import copy
+import itertools
+import logging
+import os
+import random
+import re
+import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import grpc
+
+try:
+    from pycallgraph2 import Config, GlobbingFilter, PyCallGraph
+    from pycallgraph2.output import GraphvizOutput
+except ImportError:
+    Config = GlobbingFilter = PyCallGraph = None
+    GraphvizOutput = object
+
+__all__ = [
+    "CustomGraphvizOutput",
+    "PyCallGraphInterceptor",
+    "apply_profiling_interceptor",
+]
+
+_LOGGER = logging.getLogger(__name__)
+
+_PROFILE_SAMPLE_ENV = "SPACEONE_PROFILE_SAMPLE"
+_PROFILE_METADATA_KEY = "x-profile"
+
+# Rendering a large call graph with dot can take seconds, so it must not
+# hold up the gRPC response. A single worker keeps renders serialized.
+_PROFILE_POOL = ThreadPoolExecutor(max_workers=1)
+atexit.register(_PROFILE_POOL.shutdown, wait=True)
+
+_PROFILE_DIR = os.path.join(os.path.abspath(os.path.dirname(__file__)), "profiles")
+_PROFILE_COUNTER = itertools.count()
+
+
+def _log_render_failure(future):
+    # Submitted futures are otherwise discarded, which would swallow any
+    # exception raised inside the background render.
+    exc = future.exception()
+    if exc is not None:
+        _LOGGER.warning(
+            f"[_log_render_failure] profile rendering failed: {exc!r}"
+        )
+
+_LAYERS = ["interface", "service", "manager", "lib"]
+_LAYER_RE = re.compile(r"\.(interface|service|manager|lib)\.")
+_LAYER_COLORS = {
+    "interface": "#c6dbef",
+    "service": "#9ecae1",
+    "manager": "#6baed6",
+    "lib": "#c7e9c0",
+    "other": "#d9d9d9",
+}
+
+
+class CustomGraphvizOutput(GraphvizOutput):
+    """GraphvizOutput that groups call-graph nodes by application layer
+    (interface / service / manager / lib) and renders to SVG."""
+
+    _LABEL_PREFIX = "spaceone.identity."
+    _LABEL_PREFIX_LEN = len(_LABEL_PREFIX)
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.output_type = "svg"
+
+    def node_label(self, node):
+        # Called once per node during generate(). startswith + slice, not
+        # str.removeprefix: the build still targets Python 3.8.
+        name = node.name
+        if name.startswith(self._LABEL_PREFIX):
+            return name[self._LABEL_PREFIX_LEN:]
+        return name
+
+    def generate(self):
+        indent = " " * 12
+        indent_join = "\n" + indent
+
+        # Bucket every node into its layer in a single pass instead of
+        # re-scanning the node list once per layer.
+        layers = {layer: [] for layer in _LAYERS}
+        layers["other"] = []
+        layer_search = _LAYER_RE.search
+
+        for node in self.processor.nodes():
+            match = layer_search(node.name)
+            bucket = match.group(1) if match else "other"
+            layers[bucket].append(node)
+
+        lines = ["digraph G {", f"{indent}// Attributes"]
+        lines.append(f"{indent}{indent_join.join(self.generate_attributes())};")
+
+        lines.append(f"{indent}// Groups")
+        for layer, nodes in layers.items():
+            lines.append(f"{indent}subgraph cluster_{layer} {{")
+            lines.append(f'{indent}label = "{layer}";')
+            lines.append(f'{indent}color = "{_LAYER_COLORS[layer]}";')
+            lines.extend(
+                f"{indent}{node_line}"
+                for node_line in self.generate_cluster_nodes(nodes)
+            )
+            lines.append(f"{indent}}}")
+
+        lines.append(f"{indent}// Edges")
+        lines.append(f"{indent}{indent_join.join(self.generate_edges())}")
+        lines.append("}")
+
+        return "\n".join(lines)
+
+    def generate_cluster_nodes(self, nodes):
+        node_color_func = self.node_color_func
+        node_label_func = self.node_label_func
+        attrs_from_dict = self.attrs_from_dict
+
+        output = []
+        for node in nodes:
+            attr = {
+                "color": node_color_func(node).rgba_web(),
+                "label": node_label_func(node),
+            }
+            output.append('"{}" [{}];'.format(node.name, attrs_from_dict(attr)))
+        return output
+
+    def done(self):
+        source = self.generate()
+
+        # Debug aid only; the render itself reads the source from stdin.
+        if os.environ.get("SPACEONE_PROFILE_KEEP_DOT"):
+            dot_filename = f"{os.path.splitext(self.output_file)[0]}.dot"
+            with open(dot_filename, "w") as f:
+                f.write(source)
+
+        cmd = [self.tool, f"-T{self.output_type}", "-o", self.output_file]
+
+        try:
+            proc = subprocess.Popen(
+                cmd, stdin=subprocess.PIPE, stderr=subprocess.PIPE
+            )
+            _, stderr = proc.communicate(source.encode("utf-8"))
+
+            if proc.returncode != 0:
+                _LOGGER.warning(
+                    f"[done] graphviz rendering failed: "
+                    f"{stderr.decode(errors='replace')}"
+                )
+        except OSError as e:
+            _LOGGER.warning(f"[done] graphviz rendering failed: {e}")
+
+
+class PyCallGraphInterceptor(grpc.ServerInterceptor):
+    """Wraps unary-unary handlers with a PyCallGraph trace.
+
+    Tracing (sys.settrace) multiplies the cost of every Python call, so only
+    sampled requests (1-in-``SPACEONE_PROFILE_SAMPLE``) or requests carrying
+    the ``x-profile: 1`` metadata key are traced; every other RPC is served
+    by the original, untraced handler.
+    """
+
+    def __init__(self):
+        self._sample_rate = int(os.environ.get(_PROFILE_SAMPLE_ENV, "0"))
+
+        # Built once: GlobbingFilter compiles its patterns on init and
+        # Config inspects sys.argv, neither of which belongs on the per-RPC
+        # path. Each traced call gets a shallow copy so PyCallGraph cannot
+        # mutate the shared template.
+        self._config = Config()
+        self._config.trace_filter = GlobbingFilter(include=["spaceone.identity.*"])
+
+    def intercept_service(self, continuation, handler_call_details):
+        handler = continuation(handler_call_details)
+
+        if handler is None or handler.unary_unary is None:
+            return handler
+
+        if not self._should_profile(handler_call_details.invocation_metadata):
+            return handler
+
+        return grpc.unary_unary_rpc_method_handler(
+            self._profiled_behavior(handler.unary_unary, handler_call_details.method),
+            request_deserializer=handler.request_deserializer,
+            response_serializer=handler.response_serializer,
+        )
+
+    def _should_profile(self, invocation_metadata):
+        for key, value in invocation_metadata or []:
+            if key == _PROFILE_METADATA_KEY and value == "1":
+                return True
+
+        if self._sample_rate > 0:
+            return random.randrange(self._sample_rate) == 0
+
+        return False
+
+    def _start_trace(self, method):
+        method_name = method.strip("/").replace("/", "_")
+        output = CustomGraphvizOutput()
+        output.output_file = (
+            f"{_PROFILE_DIR}/{method_name}_"
+            f"{time.time_ns()}_{next(_PROFILE_COUNTER)}.svg"
+        )
+
+        graphviz = PyCallGraph(output=output, config=copy.copy(self._config))
+        graphviz.start()
+        return graphviz, output
+
+    def _profiled_behavior(self, behavior, method):
+        def profiled_behavior(request, context):
+            graphviz, output = self._start_trace(method)
+
+            try:
+                return behavior(request, context)
+            finally:
+                # Stop tracing on the RPC thread, but serialize and render
+                # the graph in the background. Each call gets its own
+                # output/processor pair, so the snapshot is not mutated by
+                # later RPCs.
+                graphviz.stop()
+                _PROFILE_POOL.submit(output.done).add_done_callback(
+                    _log_render_failure
+                )
+
+        return profiled_behavior
+
+
+class AsyncPyCallGraphInterceptor(PyCallGraphInterceptor, grpc.aio.ServerInterceptor):
+    """Async counterpart of :class:`PyCallGraphInterceptor` for
+    ``grpc.aio`` servers.
+
+    An event loop overlaps the blocking I/O in handlers (e.g. SMTP
+    handshakes) with other requests; the interceptor only has to avoid
+    blocking the loop itself, which it does by pushing the render to the
+    shared background executor.
+    """
+
+    async def intercept_service(self, continuation, handler_call_details):
+        handler = await continuation(handler_call_details)
+
+        if handler is None or handler.unary_unary is None:
+            return handler
+
+        if not self._should_profile(handler_call_details.invocation_metadata):
+            return handler
+
+        return grpc.unary_unary_rpc_method_handler(
+            self._profiled_behavior(handler.unary_unary, handler_call_details.method),
+            request_deserializer=handler.request_deserializer,
+            response_serializer=handler.response_serializer,
+        )
+
+    def _profiled_behavior(self, behavior, method):
+        async def profiled_behavior(request, context):
+            graphviz, output = self._start_trace(method)
+
+            try:
+                return await behavior(request, context)
+            finally:
+                graphviz.stop()
+                _PROFILE_POOL.submit(output.done).add_done_callback(
+                    _log_render_failure
+                )
+
+        return profiled_behavior
+
+
+def apply_profiling_interceptor():
+    """Patch ``grpc.server`` (and ``grpc.aio.server`` when available) so
+    that servers created afterwards carry the profiling interceptor.
+
+    The environment is checked once at import time; when sampling is
+    disabled (``SPACEONE_PROFILE_SAMPLE`` unset or 0) the patch is skipped
+    entirely and no per-RPC profiling cost is paid.
+    """
+
+    if int(os.environ.get(_PROFILE_SAMPLE_ENV, "0")) <= 0:
+        return
+
+    if PyCallGraph is None:
+        _LOGGER.warning(
+            "[apply_profiling_interceptor] pycallgraph2 is not installed, "
+            "profiling is disabled"
+        )
+        return
+
+    os.makedirs(_PROFILE_DIR, exist_ok=True)
+
+    original_server = grpc.server
+
+    def profiling_server(*args, **kwargs):
+        interceptors = list(kwargs.pop("interceptors", None) or [])
+        interceptors.append(PyCallGraphInterceptor())
+        return original_server(*args, interceptors=interceptors, **kwargs)
+
+    grpc.server = profiling_server
+
+    aio = getattr(grpc, "aio", None)
+    if aio is not None:
+        original_aio_server = aio.server
+
+        def profiling_aio_server(*args, **kwargs):
+            interceptors = list(kwargs.pop("interceptors", None) or [])
+            interceptors.append(AsyncPyCallGraphInterceptor())
+            return original_aio_server(*args, interceptors=interceptors, **kwargs)
+
+        aio.server = profiling_aio_server
@@ -42,6 +42,10 @@ class BaseMFAManager(BaseManager, ABC):
 class MFAManager(BaseMFAManager, metaclass=ABCMeta):
     mfa_type: str
 
+    # mfa_type -> manager class, filled on first lookup so repeated calls
+    # skip the __subclasses__() walk. Instances stay per-call.
+    _manager_classes = {}
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._load_conf()
@@ -79,8 +83,13 @@ class MFAManager(BaseMFAManager, metaclass=ABCMeta):
 
     @classmethod
     def get_manager_by_mfa_type(cls, mfa_type):
+        manager_class = cls._manager_classes.get(mfa_type)
+        if manager_class:
+            return manager_class()
+
         for subclass in cls.__subclasses__():
             if subclass.mfa_type == mfa_type:
+                cls._manager_classes[mfa_type] = subclass
                 return subclass()
         raise ERROR_NOT_SUPPORTED_MFA_TYPE(support_mfa_types=["EMAIL", "OTP"])
 
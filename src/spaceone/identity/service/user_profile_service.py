@@ -38,6 +38,13 @@ from spaceone.identity.service.workspace_group_service import WorkspaceGroupServ
 
 _LOGGER = logging.getLogger(__name__)
 
+_SUPPORTED_MFA_TYPES = ("EMAIL", "OTP")
+
+
+def _check_mfa_options(options, mfa_type):
+    if mfa_type == "EMAIL" and not options:
+        raise ERROR_REQUIRED_PARAMETER(key="options.email")
+
 
 @authentication_handler
 @authorization_handler
@@ -101,11 +108,11 @@ class UserProfileService(BaseService):
 
         user_vo = self.user_mgr.get_user(params.user_id, params.domain_id)
 
-        required_actions = list(user_vo.required_actions)
+        required_actions = set(user_vo.required_actions)
 
         if params.required_actions:
-            required_actions.extend(params.required_actions)
-            user_vo.required_actions = list(set(required_actions))
+            required_actions.update(params.required_actions)
+            user_vo.required_actions = list(required_actions)
 
         if "UPDATE_PASSWORD" not in required_actions and not params.current_password:
             raise ERROR_REQUIRED_PARAMETER(key="current_password")
@@ -260,35 +267,40 @@ class UserProfileService(BaseService):
         options = params.options
         domain_id = params.domain_id
 
+        # Params-only checks come first so a rejected request does not pay
+        # the user fetch and MFA dict conversion.
+        if mfa_type not in _SUPPORTED_MFA_TYPES:
+            raise ERROR_NOT_SUPPORTED_MFA_TYPE(
+                support_mfa_types=list(_SUPPORTED_MFA_TYPES)
+            )
+
+        _check_mfa_options(options, mfa_type)
+
         user_vo = self.user_mgr.get_user(user_id, domain_id)
-        user_mfa = user_vo.mfa.to_dict() if user_vo.mfa else {}
-        user_mfa_type = user_mfa.get("mfa_type", None)
-        user_mfa_enforce = user_mfa.get("options", {}).get("enforce", False)
 
         if user_vo.auth_type == "EXTERNAL":
             raise ERROR_NOT_ALLOWED_ACTIONS(action="MFA")
 
+        user_mfa = user_vo.mfa.to_dict() if user_vo.mfa else {}
+        user_mfa_type = user_mfa.get("mfa_type", None)
+        user_mfa_options = user_mfa.setdefault("options", {})
+        user_mfa_enforce = user_mfa_options.get("enforce", False)
+
         if user_mfa_enforce and user_mfa_type is not None and mfa_type != user_mfa_type:
             raise ERROR_INVALID_PARAMETER(
                 key="mfa_type",
                 reason="Only requests using the MFA type enforced by admin are allowed.",
             )
 
-        self._check_mfa_options(options, mfa_type)
-
         if user_mfa.get("state", "DISABLED") == "ENABLED":
             raise ERROR_MFA_ALREADY_ENABLED(user_id=user_id)
 
         mfa_manager = MFAManager.get_manager_by_mfa_type(mfa_type)
 
         user_mfa["mfa_type"] = mfa_type
-        user_mfa["state"] = user_mfa.get("state", "DISABLED")
-        user_mfa["options"] = {**user_mfa.get("options", {}), **options}
+        user_mfa_options.update(options)
 
-        if mfa_type in ["EMAIL", "OTP"]:
-            user_vo.mfa = mfa_manager.enable_mfa(user_id, domain_id, user_mfa, user_vo)
-        else:
-            raise ERROR_NOT_SUPPORTED_MFA_TYPE(support_mfa_types=["EMAIL", "OTP"])
+        user_vo.mfa = mfa_manager.enable_mfa(user_id, domain_id, user_mfa, user_vo)
 
         return UserResponse(**user_vo.to_dict())
 
@@ -311,12 +323,20 @@ class UserProfileService(BaseService):
         domain_id = params.domain_id
 
         user_vo = self.user_mgr.get_user(user_id, domain_id)
-        user_mfa = user_vo.mfa.to_dict() if user_vo.mfa else {}
-        mfa_type = user_mfa.get("mfa_type")
-
-        if user_mfa.get("state", "DISABLED") == "DISABLED" or mfa_type is None:
+        user_vo_mfa = user_vo.mfa
+
+        # Guard off the VO fields so the already-disabled path does not pay
+        # the dict materialization it never uses.
+        if (
+            user_vo_mfa is None
+            or user_vo_mfa.state == "DISABLED"
+            or user_vo_mfa.mfa_type is None
+        ):
             raise ERROR_MFA_ALREADY_DISABLED(user_id=user_id)
 
+        user_mfa = user_vo_mfa.to_dict()
+        mfa_type = user_mfa["mfa_type"]
+
         mfa_manager = MFAManager.get_manager_by_mfa_type(mfa_type)
         mfa_manager.disable_mfa(user_id, domain_id, user_mfa, user_vo)
 
@@ -348,8 +368,9 @@ class UserProfileService(BaseService):
 
         user_vo = self.user_mgr.get_user(user_id, domain_id)
         user_mfa = user_vo.mfa.to_dict() if user_vo.mfa else {}
+        user_mfa_options = user_mfa.get("options") or {}
         mfa_state = user_mfa.get("state", "DISABLED")
-        mfa_enforce = user_mfa.get("options", {}).get("enforce", False)
+        mfa_enforce = user_mfa_options.get("enforce", False)
 
         if mfa_state == "DISABLED":
             user_mfa = MFAManager.get_mfa_info(credentials)["user_mfa"]
@@ -681,8 +702,3 @@ class UserProfileService(BaseService):
             my_workspace_groups_info.append(workspace_group_info)
 
         return my_workspace_groups_info
-
-    @staticmethod
-    def _check_mfa_options(options, mfa_type):
-        if mfa_type in ["EMAIL"] and not options:
-            raise ERROR_REQUIRED_PARAMETER(key="options.email")
@@ -3,7 +3,7 @@ import logging
 import re
 import secrets
 import string
-from typing import List, Optional, Union
+from typing import Iterable, List, Optional, Set, Union
 
 from spaceone.core import config
 from spaceone.core.service import *
@@ -250,7 +250,7 @@ class UserService(BaseService):
                 user_vo_mfa, mfa_enforce, enforce_mfa_type, False
             )
             update_user_vo["mfa"]["options"] = self._get_mfa_options_config(
-                user_vo,
+                user_vo_mfa,
                 domain_id,
                 mfa_enforce,
                 self._should_reset_current_mfa(
@@ -258,13 +258,11 @@ class UserService(BaseService):
                 ),
             )
 
-            update_require_actions = set(
-                self._get_updated_required_actions(
-                    user_vo_mfa,
-                    list(update_require_actions),
-                    mfa_enforce,
-                    enforce_mfa_type,
-                )
+            update_require_actions = self._get_updated_required_actions(
+                user_vo_mfa,
+                update_require_actions,
+                mfa_enforce,
+                enforce_mfa_type,
             )
 
         general_params = params.dict(
@@ -328,14 +326,18 @@ class UserService(BaseService):
         domain_id = params.domain_id
 
         user_vo = self.user_mgr.get_user(user_id, domain_id)
-        user_mfa = user_vo.mfa.to_dict() if user_vo.mfa else {}
-        mfa_state = user_mfa.get("state", "DISABLED")
-        mfa_type = user_mfa.get("mfa_type")
-        mfa_enforce = user_mfa.get("options", {}).get("enforce", False)
+        user_vo_mfa = user_vo.mfa
 
-        if mfa_state == "DISABLED":
+        # Guard off the VO fields so the already-disabled path does not pay
+        # the dict materialization it never uses.
+        if user_vo_mfa is None or user_vo_mfa.state == "DISABLED":
             raise ERROR_MFA_ALREADY_DISABLED(user_id=user_id)
 
+        user_mfa = user_vo_mfa.to_dict()
+        user_mfa_options = user_mfa.get("options") or {}
+        mfa_type = user_mfa.get("mfa_type")
+        mfa_enforce = user_mfa_options.get("enforce", False)
+
         update_user_vo: dict = {}
 
         # mfa base 처리
@@ -345,12 +347,14 @@ class UserService(BaseService):
 
         # option 처리
         update_user_vo["mfa"]["options"] = self._get_mfa_options_config(
-            user_vo, domain_id, mfa_enforce, True
+            user_mfa, domain_id, mfa_enforce, True
         )
 
         # required_action 처리
-        update_user_vo["required_actions"] = self._get_updated_required_actions(
-            user_mfa, user_vo.required_actions, mfa_enforce, None
+        update_user_vo["required_actions"] = list(
+            self._get_updated_required_actions(
+                user_mfa, user_vo.required_actions, mfa_enforce, None
+            )
         )
 
         user_vo = self.user_mgr.update_user_by_vo(update_user_vo, user_vo)
@@ -380,9 +384,10 @@ class UserService(BaseService):
             if user_vo.auth_type == "EXTERNAL":
                 raise ERROR_NOT_ALLOWED_ACTIONS(user_id=user_vo.user_id)
 
-        required_actions = list(set(user_vo.required_actions + new_actions))
+        required_actions = set(user_vo.required_actions)
+        required_actions.update(new_actions)
         user_vo = self.user_mgr.update_user_by_vo(
-            {"required_actions": required_actions}, user_vo
+            {"required_actions": list(required_actions)}, user_vo
         )
 
         return UserResponse(**user_vo.to_dict())
@@ -688,9 +693,8 @@ class UserService(BaseService):
 
         return refresh_timeout
 
-    def _delete_otp_secret(self, user_vo: User, domain_id: str):
-        user_vo_mfa = user_vo.mfa.to_dict() if user_vo.mfa else {}
-        user_vo_mfa_options = user_vo_mfa.get("options", {})
+    def _delete_otp_secret(self, user_mfa: dict, domain_id: str):
+        user_vo_mfa_options = user_mfa.get("options") or {}
 
         user_secret_id: Union[str, None] = user_vo_mfa_options.get(
             "user_secret_id", None
@@ -704,10 +708,10 @@ class UserService(BaseService):
     def _get_updated_required_actions(
         self,
         user_mfa: dict,
-        current_required_actions: List[str],
+        current_required_actions: Iterable[str],
         is_enforced_mfa: bool,
         enforce_mfa_type: Optional[str],
-    ) -> List[str]:
+    ) -> Set[str]:
         """
         Calculate updated required_actions based on MFA enforcement policy.
 
@@ -724,12 +728,13 @@ class UserService(BaseService):
 
         Args:
             user_mfa: Current user's MFA configuration
-            current_required_actions: Current required actions list
+            current_required_actions: Current required actions
             is_enforced_mfa: Whether MFA enforcement is enabled
             enforce_mfa_type: The MFA type to enforce (if enforcement is enabled)
 
         Returns:
-            Updated required_actions list with ENFORCE_MFA properly managed
+            Updated required_actions set with ENFORCE_MFA properly managed;
+            callers convert to a list once at the ORM write.
         """
         user_mfa_type = user_mfa.get("mfa_type", None)
         user_mfa_state = user_mfa.get("state", None)
@@ -738,23 +743,23 @@ class UserService(BaseService):
         # Remove ENFORCE_MFA if MFA enforcement is disabled
         if not is_enforced_mfa:
             required_actions.discard("ENFORCE_MFA")
-            return list(required_actions)
+            return required_actions
 
         # Remove ENFORCE_MFA if user has correct MFA type in enabled state
         if user_mfa_type == enforce_mfa_type and user_mfa_state == "ENABLED":
             required_actions.discard("ENFORCE_MFA")
-            return list(required_actions)
+            return required_actions
 
         # Add ENFORCE_MFA in other cases when enforcement is enabled:
         # - MFA type differs from enforced type
         # - MFA type matches but is disabled
         # - No MFA is configured
         required_actions.add("ENFORCE_MFA")
-        return list(required_actions)
+        return required_actions
 
     def _get_mfa_options_config(
         self,
-        user_vo: User,
+        user_mfa: dict,
         domain_id: str,
         is_enforced_mfa: bool,
         is_explicit_reset: bool,
@@ -768,7 +773,7 @@ class UserService(BaseService):
         - Handles OTP secret deletion when transitioning away from OTP MFA
 
         Args:
-            user_vo: User object containing current MFA configuration
+            user_mfa: Current user's MFA configuration
             domain_id: Domain ID for OTP secret deletion operations
             is_enforced_mfa: Whether MFA enforcement is enabled
             is_explicit_reset: Whether to explicitly reset current MFA options
@@ -782,8 +787,7 @@ class UserService(BaseService):
             - EMAIL type: options.email exists
             These are cleaned up when MFA is disabled or reset.
         """
-        user_mfa: dict = user_vo.mfa.to_dict() if user_vo.mfa else {}
-        user_mfa_options: dict = user_mfa.get("options", {})
+        user_mfa_options: dict = user_mfa.get("options") or {}
         user_mfa_state = user_mfa.get("state", None)
         user_mfa_type = user_mfa.get("mfa_type", None)
 
@@ -794,7 +798,7 @@ class UserService(BaseService):
             delete_field_map = {"OTP": "user_secret_id", "EMAIL": "email"}
             if user_mfa_type in delete_field_map:
                 if user_mfa_type == "OTP" and user_mfa_state == "ENABLED":
-                    self._delete_otp_secret(user_vo, domain_id)
+                    self._delete_otp_secret(user_mfa, domain_id)
                 new_options.pop(delete_field_map[user_mfa_type], None)
 
         # Manage enforcement flag based on policy